@@ -5,11 +5,17 @@ export MESON_SOURCE_ROOT="$2"
 export OUTPUT="$3"
 export PROFILE="$4"
 export APP_BIN="$5"
-export CARGO_TARGET_DIR="$MESON_BUILD_ROOT"/target
+export CARGO_TARGET_DIR="${CARGO_TARGET_DIR:-"$MESON_BUILD_ROOT"/target}"
 export CARGO_HOME="$MESON_BUILD_ROOT"/cargo-home
 
+if [ -z "${RUSTC_WRAPPER+set}" ] && [ -z "${CARGO_BUILD_RUSTC_WRAPPER+set}" ] && command -v sccache > /dev/null
+then
+    export RUSTC_WRAPPER="$(command -v sccache)"
+fi
+
 echo "CARGO_TARGET_DIR: $CARGO_TARGET_DIR"
 echo "CARGO_HOME: $CARGO_HOME"
+echo "RUSTC_WRAPPER: $RUSTC_WRAPPER"
 
 if [[ $PROFILE = "devel" ]]
 then